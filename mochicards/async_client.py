@@ -0,0 +1,350 @@
+from typing import AsyncIterator, Dict, List, Optional
+import asyncio
+import os
+
+import aiohttp
+import msgspec
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from mochicards.models import (
+    Card,
+    PaginatedCards,
+    CARD_DECODER,
+    PAGINATED_CARDS_DECODER,
+)
+from mochicards.errors import MochiError, MochiAuthenticationError, MochiNotFoundError
+
+# Most updates touch one or two fields; an all-None call encodes to this
+# exact body, so serialize it once at import time.
+_EMPTY_BODY = msgspec.json.encode({})
+
+
+class AsyncMochiClient:
+    """Asyncio variant of :class:`mochicards.client.MochiClient`.
+
+    All methods share a single ``aiohttp.ClientSession`` so concurrent calls
+    (e.g. ``asyncio.gather(*[client.get_card(i) for i in ids])``) overlap their
+    network round trips instead of serializing them.
+
+    Example:
+        >>> async with AsyncMochiClient() as client:
+        ...     card = await client.get_card("card_123")
+    """
+
+    BASE_URL = "https://api.mochi.cards/api"
+
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL):
+        if api_key is None:
+            api_key = os.environ.get("MOCHI_API_KEY", None)
+
+        if not api_key:
+            raise ValueError(
+                "API key must be provided either as argument or MOCHI_API_KEY environment variable"
+            )
+        self.api_key = api_key
+        self.base_url = base_url
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared session lazily, inside a running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=5),
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=10),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncMochiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _request(self, method: str, url: str, **kwargs) -> bytes:
+        """Issue an HTTP request, retrying transient connection failures.
+
+        Args:
+            method: The HTTP verb, e.g. "GET".
+            url: The full request URL.
+            **kwargs: Extra arguments forwarded to ``aiohttp``.
+
+        Returns:
+            The raw response body.
+        """
+        session = self._ensure_session()
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(3),
+            wait=wait_exponential(multiplier=0.3),
+            retry=retry_if_exception_type(
+                (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+            ),
+            reraise=True,
+        ):
+            with attempt:
+                async with session.request(method, url, **kwargs) as response:
+                    response.raise_for_status()
+                    return await response.read()
+        return b""
+
+    async def create_card(
+        self,
+        content: str,
+        deck_id: str,
+        template_id: Optional[str] = None,
+        fields: Optional[Dict] = None,
+        attachments: Optional[List] = None,
+        archived: bool = False,
+        pos: Optional[str] = None,
+        review_reverse: bool = False,
+    ) -> Card:
+        """Creates a new card.
+
+        Accepts the same arguments as ``MochiClient.create_card``.
+
+        Returns:
+            Card: The created card object.
+
+        Raises:
+            aiohttp.ClientResponseError: If the request returns an unsuccessful status code.
+        """
+        url = f"{self.base_url}/cards/"
+
+        payload = {
+            "content": content,
+            "deck-id": deck_id,
+            "template-id": template_id,
+            "fields": fields,
+            "attachments": attachments,
+            "archived?": archived,
+            "pos": pos,
+            "review-reverse?": review_reverse,
+        }
+        data = msgspec.json.encode({k: v for k, v in payload.items() if v is not None})
+
+        body = await self._request("POST", url, data=data)
+        return CARD_DECODER.decode(body)
+
+    async def get_card(self, card_id: str) -> Card:
+        """Get a card by ID.
+
+        Args:
+            card_id: The ID of the card to retrieve.
+
+        Returns:
+            Card object containing the card data.
+
+        Raises:
+            aiohttp.ClientResponseError: If the request fails.
+        """
+        url = f"{self.base_url}/cards/{card_id}"
+
+        body = await self._request("GET", url)
+        return CARD_DECODER.decode(body)
+
+    async def list_cards(
+        self,
+        deck_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        bookmark: Optional[str] = None,
+    ) -> AsyncIterator[Card]:
+        """List cards across all pages.
+
+        Args:
+            deck_id: Filter cards by deck ID.
+            limit: Max number of cards per page.
+            bookmark: Page bookmark to start from.
+
+        Yields:
+            Card objects lazily as pages are retrieved.
+        """
+        while True:
+            page_cards = await self._list_cards(
+                deck_id=deck_id, limit=limit, bookmark=bookmark
+            )
+            for card in page_cards.docs:
+                yield card
+
+            # The last page is reached when it is empty, carries no bookmark,
+            # or repeats the bookmark it was requested with.
+            if (
+                not page_cards.docs
+                or not page_cards.bookmark
+                or page_cards.bookmark == bookmark
+            ):
+                return
+
+            bookmark = page_cards.bookmark
+
+    async def list_cards_prefetch(
+        self,
+        deck_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        bookmark: Optional[str] = None,
+    ) -> AsyncIterator[Card]:
+        """List cards across all pages, fetching the next page in the background.
+
+        As soon as a page's bookmark is known the next page is requested via
+        ``asyncio.create_task``, so consumers never wait a full round trip at
+        page boundaries. Pagination is bookmark-chained, so only one page of
+        lookahead is possible.
+
+        Args:
+            deck_id: Filter cards by deck ID.
+            limit: Max number of cards per page.
+            bookmark: Page bookmark to start from.
+
+        Yields:
+            Card objects lazily as pages are retrieved.
+        """
+        page_cards = await self._list_cards(
+            deck_id=deck_id, limit=limit, bookmark=bookmark
+        )
+        while True:
+            # The last page is reached when it is empty, carries no bookmark,
+            # or repeats the bookmark it was requested with.
+            done = (
+                not page_cards.docs
+                or not page_cards.bookmark
+                or page_cards.bookmark == bookmark
+            )
+            next_page = None
+            if not done:
+                next_page = asyncio.create_task(
+                    self._list_cards(
+                        deck_id=deck_id, limit=limit, bookmark=page_cards.bookmark
+                    )
+                )
+            try:
+                for card in page_cards.docs:
+                    yield card
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+
+            if next_page is None:
+                return
+
+            bookmark = page_cards.bookmark
+            page_cards = await next_page
+
+    async def _list_cards(
+        self,
+        deck_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        bookmark: Optional[str] = None,
+    ) -> PaginatedCards:
+        """Get a single page of cards.
+
+        Args:
+            deck_id: Filter cards by deck ID.
+            limit: Max number of cards per page.
+            bookmark: Page bookmark to start from.
+
+        Returns:
+            PaginatedCards containing a list of cards and bookmark.
+        """
+        url = f"{self.base_url}/cards/"
+        params = {"deck-id": deck_id, "limit": limit, "bookmark": bookmark}
+        params = {k: v for k, v in params.items() if v is not None}
+
+        body = await self._request("GET", url, params=params)
+        return PAGINATED_CARDS_DECODER.decode(body)
+
+    async def update_card(
+        self,
+        card_id: str,
+        content: Optional[str] = None,
+        deck_id: Optional[str] = None,
+        fields: Optional[Dict] = None,
+        attachments: Optional[List[dict]] = None,
+        archived: Optional[bool] = None,
+        pos: Optional[str] = None,
+    ) -> Card:
+        """Update an existing card.
+
+        Accepts the same arguments as ``MochiClient.update_card``.
+
+        Returns:
+            Card: The updated card object.
+
+        Raises:
+            aiohttp.ClientResponseError: If the request returns an unsuccessful status code.
+        """
+        url = f"{self.base_url}/cards/{card_id}"
+
+        payload = {
+            k: v
+            for k, v in (
+                ("content", content),
+                ("deck-id", deck_id),
+                ("fields", fields),
+                ("attachments", attachments),
+                ("archived?", archived),
+                ("pos", pos),
+            )
+            if v is not None
+        }
+        data = msgspec.json.encode(payload) if payload else _EMPTY_BODY
+
+        body = await self._request("POST", url, data=data)
+        return CARD_DECODER.decode(body)
+
+    async def delete_card(self, card_id: str) -> None:
+        """Delete a card.
+
+        WARNING: This action cannot be undone. For a "soft" deletion use
+        :meth:`trash_card` instead.
+
+        Args:
+            card_id: The ID of the card to delete.
+        """
+        url = f"{self.base_url}/cards/{card_id}"
+        await self._request("DELETE", url)
+
+    async def trash_card(self, card_id: str) -> Dict:
+        """Move a card to the trash.
+
+        This method will perform a soft delete on the card, allowing for potential recovery.
+
+        Args:
+            card_id: The unique identifier of the card to be trashed.
+
+        Returns:
+            dict: The updated card details, reflecting its trashed status.
+
+        Raises:
+            MochiError: If the request encounters an error.
+        """
+        url = f"{self.base_url}/cards/{card_id}/trash"
+        session = self._ensure_session()
+
+        async with session.post(url) as response:
+            if response.status == 401:
+                raise MochiAuthenticationError("Invalid API key provided.")
+            elif response.status == 404:
+                raise MochiNotFoundError(f"Card with ID {card_id} not found.")
+            elif response.status >= 400:
+                try:
+                    body = await response.json()
+                    error_detail = body.get("message", "Unknown error occurred.")
+                except aiohttp.ContentTypeError:
+                    error_detail = "Unknown error occurred."
+                raise MochiError(f"Failed to trash card: {error_detail}")
+
+            return await response.json()
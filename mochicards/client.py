@@ -1,15 +1,41 @@
 from typing import Dict, List, Optional, Iterable
-from mochicards.models import Card, CardData, Deck, Template, PaginatedCards
-from datetime import datetime
+from mochicards.models import (
+    Card,
+    PaginatedCards,
+    CARD_DECODER,
+    PAGINATED_CARDS_DECODER,
+)
 from mochicards.errors import MochiError, MochiAuthenticationError, MochiNotFoundError
+import msgspec
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import LFUCache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
+import threading
+import time
+from types import MappingProxyType
+
+
+# Most updates touch one or two fields; an all-None call encodes to this
+# exact body, so serialize it once at import time.
+_EMPTY_BODY = msgspec.json.encode({})
 
 
 class MochiClient:
     BASE_URL = "https://api.mochi.cards/api"
+    CACHE_MAXSIZE = 1024
+    GET_CARD_TTL = 30.0
+    LIST_CARDS_TTL = 10.0
 
-    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = BASE_URL,
+        timeout: float = 5.0,
+        warm: bool = False,
+    ):
         if api_key is None:
             api_key = os.environ.get("MOCHI_API_KEY", None)
 
@@ -19,10 +45,126 @@ class MochiClient:
             )
         self.api_key = api_key
         self.base_url = base_url
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        self._timeout = timeout
+        # Read-only so the mapping is safe to share across worker threads.
+        self.headers = MappingProxyType(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # Retries run inside the session, so backoffs reuse the already-open
+        # pooled connection instead of paying a fresh TLS handshake each try.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+            ),
+        )
+        self._session.mount("https://", adapter)
+        # LFUCache mutates internal state even on reads, so every cache
+        # operation takes this lock; the bulk helpers and the list_cards
+        # prefetch thread hit the cache concurrently.
+        self._cache: LFUCache = LFUCache(maxsize=self.CACHE_MAXSIZE)
+        self._cache_lock = threading.Lock()
+        # Precomputed once; per-call f-string formatting shows up in profiles
+        # of tight bulk loops.
+        self._cards_root = f"{self.base_url}/cards/"
+        if warm:
+            self.prewarm()
+
+    def prewarm(self) -> None:
+        """Open a pooled connection in the background.
+
+        Dispatches a throwaway request on a daemon thread so the DNS lookup
+        and TLS handshake overlap with the caller's remaining setup work; the
+        first real request then draws the already-open socket from the pool.
+        """
+
+        def _handshake():
+            try:
+                self._session.head(self.base_url, timeout=self._timeout)
+            except requests.RequestException:
+                pass
+
+        threading.Thread(target=_handshake, daemon=True).start()
+
+    @staticmethod
+    def _json(response) -> Dict:
+        """Decode a JSON response straight from bytes, skipping requests'
+        encoding detection and str round-trip."""
+        return msgspec.json.decode(response.content)
+
+    @staticmethod
+    def _read_body(response) -> bytes:
+        """Stream the body into a single buffer in large chunks.
+
+        Avoids requests' default small-chunk accumulation and its cached
+        .content copy for responses that are decoded exactly once.
+        """
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            buffer += chunk
+        return bytes(buffer)
+
+    def _cached_get(self, url, params, parser, ttl, stream=False):
+        """Issue a GET request through a short-TTL in-process cache.
+
+        Args:
+            url: The request URL.
+            params: Query parameters, or None.
+            parser: Callable turning a response into the value to cache.
+            ttl: Seconds the cached value stays fresh.
+            stream: Whether to defer body download to the parser.
+
+        Returns:
+            The parsed response, served from cache when fresh. If the request
+            fails and a stale value is cached, the stale value is returned
+            instead of raising.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+
+        try:
+            with self._session.get(
+                url, params=params, timeout=self._timeout, stream=stream
+            ) as response:
+                response.raise_for_status()
+                value = parser(response)
+        except requests.RequestException:
+            if entry is not None:
+                return entry[1]
+            raise
+
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def _invalidate_card(self, card_id: str) -> None:
+        """Drop cached entries that may reference the given card."""
+        with self._cache_lock:
+            self._cache.pop((self._cards_root + card_id, ()), None)
+            for key in [k for k in self._cache if k[0] == self._cards_root]:
+                self._cache.pop(key, None)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "MochiClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def create_card(
         self,
@@ -65,23 +207,24 @@ class MochiClient:
                 )
         """
 
-        url = f"{self.base_url}/cards/"
-
-        data = CardData(
-            content=content,
-            deck_id=deck_id,
-            template_id=template_id,
-            fields=fields,
-            attachments=attachments,
-            archived=archived,
-            pos=pos,
-            review_reverse=review_reverse,
-        ).dict()
+        url = self._cards_root
+
+        payload = {
+            "content": content,
+            "deck-id": deck_id,
+            "template-id": template_id,
+            "fields": fields,
+            "attachments": attachments,
+            "archived?": archived,
+            "pos": pos,
+            "review-reverse?": review_reverse,
+        }
+        body = msgspec.json.encode({k: v for k, v in payload.items() if v is not None})
 
-        response = requests.post(url, json=data, headers=self.headers, timeout=5)
+        response = self._session.post(url, data=body, timeout=self._timeout)
         response.raise_for_status()
 
-        return Card(**response.json())
+        return CARD_DECODER.decode(response.content)
 
     def get_card(self, card_id: str) -> Card:
         """Get a card by ID.
@@ -96,12 +239,11 @@ class MochiClient:
         HTTPError: If the request fails.
         """
 
-        url = f"{self.base_url}/cards/{card_id}"
-
-        response = requests.get(url, headers=self.headers, timeout=5)
-        response.raise_for_status()
+        url = self._cards_root + card_id
 
-        return Card(**response.json())
+        return self._cached_get(
+            url, None, lambda response: CARD_DECODER.decode(response.content), self.GET_CARD_TTL
+        )
 
     def list_cards(
         self,
@@ -117,19 +259,42 @@ class MochiClient:
             bookmark: Page bookmark to start from.
 
         Yields:
-            Card objects lazily as pages are retrieved.
+            Card objects lazily as pages are retrieved. The next page is
+            fetched on a background thread while the current page's cards are
+            being consumed, hiding one round trip per page boundary.
         """
-        while True:
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
             page_cards = self._list_cards(
                 deck_id=deck_id, limit=limit, bookmark=bookmark
             )
-            if not page_cards.docs or not page_cards.bookmark:
-                break
-
-            for card in page_cards.docs:
-                yield card
-
-            bookmark = page_cards.bookmark
+            while True:
+                # The last page is reached when it is empty, carries no
+                # bookmark, or repeats the bookmark it was requested with.
+                done = (
+                    not page_cards.docs
+                    or not page_cards.bookmark
+                    or page_cards.bookmark == bookmark
+                )
+                future = None
+                if not done:
+                    future = executor.submit(
+                        self._list_cards,
+                        deck_id=deck_id,
+                        limit=limit,
+                        bookmark=page_cards.bookmark,
+                    )
+
+                for card in page_cards.docs:
+                    yield card
+
+                if future is None:
+                    return
+
+                bookmark = page_cards.bookmark
+                page_cards = future.result()
+        finally:
+            executor.shutdown()
 
     def _list_cards(
         self,
@@ -148,12 +313,26 @@ class MochiClient:
             PaginatedCards containing a list of cards and bookmark.
         """
 
-        url = f"{self.base_url}/cards/"
-        params = {"deck-id": deck_id, "limit": limit, "bookmark": bookmark}
-        response = requests.get(url, params=params, headers=self.headers, timeout=5)
-        response.raise_for_status()
+        url = self._cards_root
+        # Omit unset params so identical logical requests share one URL (and
+        # one cache key) regardless of which filters were left at None.
+        params = {
+            k: v
+            for k, v in (
+                ("deck-id", deck_id),
+                ("limit", limit),
+                ("bookmark", bookmark),
+            )
+            if v is not None
+        }
 
-        return PaginatedCards(**response.json())
+        return self._cached_get(
+            url,
+            params,
+            lambda response: PAGINATED_CARDS_DECODER.decode(self._read_body(response)),
+            self.LIST_CARDS_TTL,
+            stream=True,
+        )
 
     def update_card(
         self,
@@ -182,21 +361,27 @@ class MochiClient:
         Raises:
             HTTPError: If the request returns an unsuccessful status code.
         """
-        url = f"{self.base_url}/cards/{card_id}"
-
-        data = CardData(
-            content=content,
-            deck_id=deck_id,
-            fields=fields,
-            attachments=attachments,
-            archived=archived,
-            pos=pos,
-        ).dict()
-
-        response = requests.post(url, json=data, headers=self.headers, timeout=5)
+        url = self._cards_root + card_id
+
+        payload = {
+            k: v
+            for k, v in (
+                ("content", content),
+                ("deck-id", deck_id),
+                ("fields", fields),
+                ("attachments", attachments),
+                ("archived?", archived),
+                ("pos", pos),
+            )
+            if v is not None
+        }
+        body = msgspec.json.encode(payload) if payload else _EMPTY_BODY
+
+        response = self._session.post(url, data=body, timeout=self._timeout)
         response.raise_for_status()
+        self._invalidate_card(card_id)
 
-        return Card(**response.json())
+        return CARD_DECODER.decode(response.content)
 
     def delete_card(self, card_id: str) -> None:
         """Delete a card.
@@ -207,9 +392,61 @@ class MochiClient:
             card-id (string) - The ID of the card to delete.
 
         """
-        url = f"{self.base_url}/cards/{card_id}"
-        response = requests.delete(url, headers=self.headers, timeout=5)
+        url = self._cards_root + card_id
+        response = self._session.delete(url, timeout=self._timeout)
         response.raise_for_status()
+        self._invalidate_card(card_id)
+
+    def bulk_get_cards(
+        self, card_ids: Iterable[str], max_concurrency: int = 8
+    ) -> List[Card]:
+        """Fetch many cards concurrently over the pooled session.
+
+        Args:
+            card_ids: IDs of the cards to retrieve.
+            max_concurrency: Max number of requests in flight at once.
+
+        Returns:
+            List[Card]: The cards, in the same order as card_ids.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(self.get_card, card_ids))
+
+    def bulk_create_cards(
+        self, payloads: Iterable[Dict], max_concurrency: int = 8
+    ) -> List[Card]:
+        """Create many cards concurrently over the pooled session.
+
+        Args:
+            payloads: Keyword-argument dicts, each passed to create_card.
+            max_concurrency: Max number of requests in flight at once.
+
+        Returns:
+            List[Card]: The created cards, in the same order as payloads.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(self.create_card, **payload) for payload in payloads
+            ]
+            return [future.result() for future in futures]
+
+    def bulk_delete_cards(
+        self, card_ids: Iterable[str], max_concurrency: int = 8
+    ) -> None:
+        """Delete many cards concurrently over the pooled session.
+
+        WARNING: This action cannot be undone; see delete_card.
+
+        Args:
+            card_ids: IDs of the cards to delete.
+            max_concurrency: Max number of requests in flight at once.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(self.delete_card, card_id) for card_id in card_ids
+            ]
+            for future in as_completed(futures):
+                future.result()
 
     def trash_card(self, card_id):
         """
@@ -227,9 +464,9 @@ class MochiClient:
             MochiError: If the request encounters an error.
         """
 
-        url = f"{self.BASE_URL}/cards/{card_id}/trash"
+        url = self._cards_root + card_id + "/trash"
 
-        response = requests.post(url, headers=self.headers)
+        response = self._session.post(url, timeout=self._timeout)
 
         # Handle errors
         if response.status_code == 401:
@@ -237,7 +474,13 @@ class MochiClient:
         elif response.status_code == 404:
             raise MochiNotFoundError(f"Card with ID {card_id} not found.")
         elif not response.ok:
-            error_detail = response.json().get("message", "Unknown error occurred.")
+            try:
+                error_detail = self._json(response).get("message", "Unknown error occurred.")
+            except ValueError:
+                # Some 4xx/5xx responses carry non-JSON bodies.
+                error_detail = "Unknown error occurred."
             raise MochiError(f"Failed to trash card: {error_detail}")
 
-        return response.json()
+        self._invalidate_card(card_id)
+
+        return self._json(response)
@@ -1,61 +1,71 @@
 from datetime import datetime
 from typing import Optional, List, Dict
-from pydantic import BaseModel
 
+import msgspec
 
-class Card(BaseModel):
+
+class Card(
+    msgspec.Struct,
+    rename={
+        "created_at": "created-at",
+        "updated_at": "updated-at",
+        "template_id": "template-id",
+        "archived": "archived?",
+        "deck_id": "deck-id",
+    },
+):
     id: str
     content: str
     deck_id: str
+    created_at: Dict[str, datetime]
+    updated_at: Dict[str, datetime]
     template_id: Optional[str] = None
     fields: Dict = {}
     attachments: List = []
     archived: bool = False
     pos: Optional[str] = None
-    created_at: Dict[str, datetime]
-    updated_at: Dict[str, datetime]
     tags: List[str] = []
-    name: Optional[str]
+    name: Optional[str] = None
     references: List[str] = []
     reviews: List[str] = []
 
-    class Config:
-        fields = {
-            "created_at": "created-at",
-            "updated_at": "updated-at",
-            "template_id": "template-id",
-            "archived": "archived?",
-            "new": "new?",
-            "deck_id": "deck-id",
-        }
-
 
-class PaginatedCards(BaseModel):
-    bookmark: Optional[str]
-    docs: List[Card]
+class PaginatedCards(msgspec.Struct):
+    bookmark: Optional[str] = None
+    docs: List[Card] = []
 
 
-class CardData(BaseModel):
-    content: str
-    deck_id: str
+class CardData(msgspec.Struct):
+    content: Optional[str] = None
+    deck_id: Optional[str] = None
     template_id: Optional[str] = None
     fields: Optional[Dict] = None
     attachments: Optional[List] = None
-    archived: bool = False
+    archived: Optional[bool] = False
     pos: Optional[str] = None
     review_reverse: bool = False
 
+    def dict(self) -> Dict:
+        """Return a plain-dict view, mirroring the old Pydantic API."""
+        return msgspec.to_builtins(self)
+
+
+# Compiled decoders parse and validate JSON bytes in a single C-level pass,
+# skipping the intermediate json.loads -> dict -> per-field validation chain.
+CARD_DECODER = msgspec.json.Decoder(Card)
+PAGINATED_CARDS_DECODER = msgspec.json.Decoder(PaginatedCards)
 
-class Deck(BaseModel):
+
+class Deck(msgspec.Struct):
     id: str
     name: str
-    parent_id: Optional[str] = None
     sort: int
+    parent_id: Optional[str] = None
     archived: bool = False
     trashed: Optional[datetime] = None
 
 
-class Template(BaseModel):
+class Template(msgspec.Struct):
     id: str
     name: str
     content: str
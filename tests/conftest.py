@@ -1,7 +1,13 @@
 import pytest
 from mochicards.client import MochiClient
+from mochicards.async_client import AsyncMochiClient
 
 
 @pytest.fixture
 def mochi_client():
     return MochiClient()
+
+
+@pytest.fixture
+def async_mochi_client():
+    return AsyncMochiClient()
@@ -0,0 +1,134 @@
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from mochicards.async_client import AsyncMochiClient
+from mochicards.errors import MochiError, MochiAuthenticationError, MochiNotFoundError
+
+
+def _card_doc(card_id, pos):
+    return {
+        "tags": [],
+        "content": "# Hello, world!",
+        "name": "Hello world",
+        "deck-id": "eH53Hxe8",
+        "fields": {},
+        "pos": pos,
+        "references": [],
+        "id": card_id,
+        "reviews": [],
+        "created-at": {"date": "2021-09-09T02:49:58.535Z"},
+        "updated-at": {"date": "2021-09-09T02:49:58.535Z"},
+    }
+
+
+@pytest.fixture
+def first_page_response():
+    return {
+        "bookmark": "bookmark1",
+        "docs": [_card_doc("card_1", "1"), _card_doc("card_2", "2")],
+    }
+
+
+@pytest.fixture
+def second_page_response():
+    return {
+        "bookmark": "bookmark2",
+        "docs": [_card_doc("card_3", "1"), _card_doc("card_4", "2")],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["list_cards", "list_cards_prefetch"])
+async def test_list_cards_multiple_pages(
+    async_mochi_client, first_page_response, second_page_response, method
+):
+    with aioresponses() as m:
+        m.get(f"{AsyncMochiClient.BASE_URL}/cards/", payload=first_page_response)
+        m.get(
+            f"{AsyncMochiClient.BASE_URL}/cards/?bookmark=bookmark1",
+            payload=second_page_response,
+        )
+        m.get(
+            f"{AsyncMochiClient.BASE_URL}/cards/?bookmark=bookmark2",
+            payload={"bookmark": None, "docs": []},
+        )
+
+        async with async_mochi_client as client:
+            cards = [card async for card in getattr(client, method)()]
+
+        assert [card.id for card in cards] == ["card_1", "card_2", "card_3", "card_4"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["list_cards", "list_cards_prefetch"])
+async def test_list_cards_last_page_without_bookmark(
+    async_mochi_client, first_page_response, method
+):
+    final_page = dict(first_page_response, bookmark=None)
+
+    # Only one response is registered; a second request would fail.
+    with aioresponses() as m:
+        m.get(f"{AsyncMochiClient.BASE_URL}/cards/", payload=final_page)
+
+        async with async_mochi_client as client:
+            cards = [card async for card in getattr(client, method)()]
+
+        assert [card.id for card in cards] == ["card_1", "card_2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["list_cards", "list_cards_prefetch"])
+async def test_list_cards_repeated_bookmark_terminates(
+    async_mochi_client, first_page_response, method
+):
+    with aioresponses() as m:
+        m.get(f"{AsyncMochiClient.BASE_URL}/cards/", payload=first_page_response)
+        m.get(
+            f"{AsyncMochiClient.BASE_URL}/cards/?bookmark=bookmark1",
+            payload=first_page_response,
+        )
+
+        async with async_mochi_client as client:
+            cards = [card async for card in getattr(client, method)()]
+
+        assert len(cards) == 4
+
+
+@pytest.mark.asyncio
+async def test_get_card_retries_on_connection_error(async_mochi_client):
+    card_id = "card_1"
+    url = f"{AsyncMochiClient.BASE_URL}/cards/{card_id}"
+
+    with aioresponses() as m:
+        m.get(url, exception=aiohttp.ClientConnectionError("reset"))
+        m.get(url, payload=_card_doc(card_id, "1"))
+
+        async with async_mochi_client as client:
+            card = await client.get_card(card_id)
+
+        assert card.id == card_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, expected_error",
+    [
+        (401, MochiAuthenticationError),
+        (404, MochiNotFoundError),
+        (500, MochiError),
+    ],
+)
+async def test_trash_card_error_mapping(async_mochi_client, status, expected_error):
+    card_id = "card_1"
+
+    with aioresponses() as m:
+        m.post(
+            f"{AsyncMochiClient.BASE_URL}/cards/{card_id}/trash",
+            status=status,
+            payload={"message": "something went wrong"},
+        )
+
+        async with async_mochi_client as client:
+            with pytest.raises(expected_error):
+                await client.trash_card(card_id)
@@ -76,6 +76,12 @@ def second_page_response():
     }
 
 
+def test_client_context_manager(mochi_client):
+    with mochi_client as client:
+        assert client is mochi_client
+        assert client._session.headers["Authorization"].startswith("Bearer ")
+
+
 def test_create_card_success(mocker, mochi_client):
     card_data = {"content": "Hello world", "deck_id": "deck_123", "archived": False}
 
@@ -160,6 +166,109 @@ def test_get_card_fail(mochi_client):
             mochi_client.get_card(card_id)
 
 
+def test_bulk_delete_cards(mochi_client):
+    card_ids = ["card_1", "card_2", "card_3"]
+
+    with requests_mock.Mocker() as m:
+        for card_id in card_ids:
+            m.delete(f"{MochiClient.BASE_URL}/cards/{card_id}", status_code=200)
+
+        mochi_client.bulk_delete_cards(card_ids)
+
+        assert m.call_count == 3
+
+
+def test_bulk_get_cards_concurrent_cache_access(mochi_client):
+    expected_response = {
+        "updated-at": {"date": "2021-09-11T14:23:53.250Z"},
+        "tags": [],
+        "content": "Sample content",
+        "name": "Sample Card",
+        "deck-id": "deck_456",
+        "fields": {},
+        "pos": "00F",
+        "references": [],
+        "id": "card_456",
+        "reviews": [],
+        "created-at": {"date": "2021-09-10T01:29:49.879Z"},
+    }
+    # Repeated IDs so worker threads hammer the same cache entries at once;
+    # without locking this raises spurious KeyErrors inside cachetools.
+    card_ids = [f"card_{i}" for i in range(50)] * 4
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=expected_response)
+
+        cards = mochi_client.bulk_get_cards(card_ids)
+
+        assert len(cards) == len(card_ids)
+
+
+def test_get_card_cached(mochi_client):
+    card_id = "card_456"
+    expected_response = {
+        "updated-at": {"date": "2021-09-11T14:23:53.250Z"},
+        "tags": [],
+        "content": "Sample content",
+        "name": "Sample Card",
+        "deck-id": "deck_456",
+        "pos": "00F",
+        "references": [],
+        "id": "card_456",
+        "reviews": [],
+        "created-at": {"date": "2021-09-10T01:29:49.879Z"},
+        "new?": False,
+        "archived?": False,
+        "template-id": None,
+    }
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{MochiClient.BASE_URL}/cards/{card_id}", json=expected_response)
+
+        first = mochi_client.get_card(card_id)
+        second = mochi_client.get_card(card_id)
+
+        assert m.call_count == 1
+        assert first.id == second.id == "card_456"
+
+
+def test_get_card_stale_fallback(mochi_client):
+    card_id = "card_456"
+    expected_response = {
+        "updated-at": {"date": "2021-09-11T14:23:53.250Z"},
+        "tags": [],
+        "content": "Sample content",
+        "name": "Sample Card",
+        "deck-id": "deck_456",
+        "pos": "00F",
+        "references": [],
+        "id": "card_456",
+        "reviews": [],
+        "created-at": {"date": "2021-09-10T01:29:49.879Z"},
+        "new?": False,
+        "archived?": False,
+        "template-id": None,
+    }
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{MochiClient.BASE_URL}/cards/{card_id}", json=expected_response)
+        mochi_client.get_card(card_id)
+
+    # Expire the cached entry so the next call has to go to the network.
+    key = next(iter(mochi_client._cache))
+    mochi_client._cache[key] = (0.0, mochi_client._cache[key][1])
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            f"{MochiClient.BASE_URL}/cards/{card_id}",
+            exc=requests.ConnectionError,
+        )
+
+        result = mochi_client.get_card(card_id)
+
+        assert result.id == "card_456"
+
+
 def test_list_cards_single_page(mochi_client, first_page_response):
     with requests_mock.Mocker() as m:
         m.get(f"{MochiClient.BASE_URL}/cards/", json=first_page_response)
@@ -196,3 +305,34 @@ def test_list_cards_multiple_pages(
         assert cards[0].id == "card_1"
         assert cards[1].id == "card_2"
         assert cards[2].id == "card_3"
+        assert cards[3].id == "card_4"
+
+
+def test_list_cards_last_page_without_bookmark(mochi_client, first_page_response):
+    final_page = dict(first_page_response, bookmark=None)
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{MochiClient.BASE_URL}/cards/", json=final_page)
+
+        cards = list(mochi_client.list_cards())
+
+        assert [card.id for card in cards] == ["card_1", "card_2"]
+        assert m.call_count == 1
+
+
+def test_list_cards_repeated_bookmark_terminates(mochi_client, first_page_response):
+    with requests_mock.Mocker() as m:
+        m.get(
+            f"{MochiClient.BASE_URL}/cards/",
+            json=first_page_response,
+            additional_matcher=lambda req: "bookmark" not in req.url,
+        )
+        m.get(
+            f"{MochiClient.BASE_URL}/cards/?bookmark=bookmark1",
+            json=first_page_response,
+        )
+
+        cards = list(mochi_client.list_cards())
+
+        assert len(cards) == 4
+        assert m.call_count == 2